@@ -6,7 +6,7 @@ __version__ = "0.7.1"
 PACKAGE_PATH = os.path.dirname(os.path.abspath(__file__))
 
 BLOG_TEMPLATE_PATH = os.path.join(PACKAGE_PATH, "templates", "blog.html")
-BLOG_TEMPLATE_VERSION = "2.0"
+BLOG_TEMPLATE_VERSION = "2.1"
 
 CLI_PATH = os.path.join(PACKAGE_PATH, "cli.py")
 CLI_VERSION = __version__
@@ -16,12 +16,20 @@ WEBAPP_VERSION = __version__
 
 from .aggregator import (
     aggregate,
+    aggregate_json,
+    dumps_news,
+    warm_up,
+    NewsItem,
     FILE_PATH as AGGREGATOR_PATH,
     FILE_VERSION as AGGREGATOR_VERSION,
 )
 
 __all__ = [
     "aggregate",
+    "aggregate_json",
+    "dumps_news",
+    "warm_up",
+    "NewsItem",
     "__version__",
     "PACKAGE_PATH",
     "AGGREGATOR_PATH",
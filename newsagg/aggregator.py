@@ -7,19 +7,57 @@ main image when available.
 
 from __future__ import annotations
 
+import html
+import json
 import logging
 import os
 import re
-from typing import List, Dict, Tuple
+import threading
+from html.entities import html5 as _HTML5_ENTITIES
+from itertools import islice
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, NamedTuple, Tuple
 from urllib.parse import urljoin
 
-import feedparser
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector, SelectorError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import h2  # noqa: F401  pylint: disable=unused-import
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HTTP2 = False
+
+try:
+    from hishel import CacheOptions, SpecificationPolicy, SyncSqliteStorage
+    from hishel.httpx import SyncCacheTransport
+except ImportError:  # pragma: no cover - optional speedup
+    SyncCacheTransport = None
 
 logger = logging.getLogger(__name__)
 
+_PAGE_RE = re.compile(r"page=(\d+)")
+_PAGER_SELECTOR = "nav.pagination, .pager, ul.pagination"
+_TAG_RE = re.compile(r"<[^>]+>")
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.IGNORECASE)
+_MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_FEED_ITEM_TAGS = ("item", _RSS1_NS + "item", _ATOM_NS + "entry")
+# HTML named entities are undeclared in XML and would cut text short
+_ENTITY_RE = re.compile(rb"&([A-Za-z][A-Za-z0-9]*);")
+_XML_ENTITIES = {b"amp", b"lt", b"gt", b"quot", b"apos"}
+
 # Configuration: list of news sources with precise CSS selectors and optional pagination
 # You can optionally include 'max_pages' to cap the number of pages fetched per source
 SOURCES = [
@@ -81,26 +119,105 @@ SOURCES = [
 
 from . import __version__
 
+
+class NewsItem(NamedTuple):
+    """A single headline collected from a source."""
+
+    source: str
+    title: str
+    link: str
+    preview: str = ""
+    image: str = ""
+
+
 FILE_PATH = os.path.abspath(__file__)
 FILE_VERSION = __version__
 
-_SESSION = requests.Session()
-_SESSION.headers.update({"User-Agent": f"NewsAgg/{__version__}"})
+CACHE_PATH = "newsagg_cache.db"
+CACHE_TTL = 300
+
+# Sized for every source plus the preview pool fetching at once, so concurrent
+# requests keep their connections alive instead of reopening them
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE = 64
+
+
+def _make_transport() -> httpx.BaseTransport:
+    """Return the pooled transport, wrapped in an HTTP cache when available.
+
+    The cache honours ``Cache-Control`` and revalidates stale entries with
+    ``If-None-Match``/``If-Modified-Since`` so unchanged pages come back as 304s.
+    """
+    transport = httpx.HTTPTransport(
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_KEEPALIVE,
+        ),
+        retries=2,
+    )
+    if SyncCacheTransport is None:
+        return transport
+    return SyncCacheTransport(
+        next_transport=transport,
+        storage=SyncSqliteStorage(database_path=CACHE_PATH, default_ttl=CACHE_TTL),
+        policy=SpecificationPolicy(cache_options=CacheOptions(shared=False)),
+    )
+
+
+# One pooled client for all requests; HTTP/2 multiplexes requests to the same
+# origin over a single connection when ``h2`` is installed. httpx already sends
+# ``Accept-Encoding: gzip, deflate`` and adds ``br``/``zstd`` only when the
+# matching decoder package is installed, so the header is left to it.
+_SESSION = httpx.Client(
+    transport=_make_transport(),
+    headers={"User-Agent": f"NewsAgg/{__version__}"},
+    timeout=10,
+    follow_redirects=True,
+)
+
+# Shared pool for per-article preview/image requests so they overlap
+_PREVIEW_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="newsagg-preview")
+
+
+def _img_src(img: lxml.html.HtmlElement) -> str:
+    """Return the real source of ``img``, preferring lazy-load ``data-src``.
+
+    Inline ``data:`` URIs are lazy-loading placeholders, not article images.
+    """
+    src = img.get("data-src") or img.get("src") or ""
+    return "" if src.startswith("data:") else src
+
+
+def _doc_preview(doc: lxml.html.HtmlElement) -> str:
+    meta = doc.find(".//meta[@name='description'][@content]")
+    if meta is not None and meta.get("content"):
+        return meta.get("content")[:200]
+    para = doc.find(".//p")
+    return _node_text(para)[:200] if para is not None else ""
+
+
+def _doc_image(doc: lxml.html.HtmlElement, url: str) -> str:
+    meta = doc.find(".//meta[@property='og:image'][@content]")
+    if meta is not None and meta.get("content"):
+        return _absolute_url(url, meta.get("content"))
+    for img in doc.iter("img"):
+        src = _img_src(img)
+        if src:
+            return _absolute_url(url, src)
+    return ""
+
+
+def _fetch_article(url: str) -> lxml.html.HtmlElement:
+    resp = _SESSION.get(url, timeout=5)
+    resp.raise_for_status()
+    return _make_tree(resp.content, resp.charset_encoding)
 
 
 def extract_preview(url: str) -> str:
     """Return a short text preview for an article."""
     try:
-        resp = _SESSION.get(url, timeout=5)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        meta = soup.find("meta", attrs={"name": "description"})
-        if meta and meta.get("content"):
-            text = meta["content"]
-        else:
-            para = soup.find("p")
-            text = para.get_text(strip=True) if para else ""
-        return text[:200]
+        return _doc_preview(_fetch_article(url))
     except Exception as exc:  # pylint: disable=broad-except
         logger.debug("Preview error %s: %s", url, exc)
         return ""
@@ -109,137 +226,438 @@ def extract_preview(url: str) -> str:
 def extract_image(url: str) -> str:
     """Return the URL of the main image for an article."""
     try:
-        resp = _SESSION.get(url, timeout=5)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        meta = soup.find("meta", property="og:image")
-        if meta and meta.get("content"):
-            img_url = meta["content"]
-        else:
-            img = soup.find("img")
-            img_url = img.get("src") if img and img.get("src") else ""
-        return img_url
+        return _doc_image(_fetch_article(url), url)
     except Exception as exc:  # pylint: disable=broad-except
         logger.debug("Image error %s: %s", url, exc)
         return ""
 
 
-def get_max_pages_from_soup(soup: BeautifulSoup) -> int:
-    """Detect the maximum page number from pagination links."""
-    pages = []
-    for link in soup.select("a[href]"):
-        href = link["href"]
-        match = re.search(r"page=(\d+)", href)
-        if match:
-            pages.append(int(match.group(1)))
-    return max(pages) if pages else 1
+def extract_details(url: str, preview: str = "", image: str = "") -> Tuple[str, str]:
+    """Fill in whichever of ``preview``/``image`` is missing from one fetch of the article."""
+    try:
+        doc = _fetch_article(url)
+        return preview or _doc_preview(doc), image or _doc_image(doc, url)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug("Details error %s: %s", url, exc)
+        return preview, image
+
+
+_LOCAL = threading.local()
+
+
+def _html_parser(encoding: str | None) -> lxml.html.HTMLParser:
+    """Return this thread's reusable HTML parser for ``encoding``.
+
+    lxml parsers may not be shared between threads, so every worker keeps its own
+    set instead of building a fresh parser for each page.
+    """
+    parsers = getattr(_LOCAL, "parsers", None)
+    if parsers is None:
+        parsers = _LOCAL.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml.html.HTMLParser(encoding=encoding, recover=True)
+    return parser
+
+
+def _rss_parser() -> etree.XMLParser:
+    """Return this thread's reusable feed parser.
+
+    Feeds are untrusted input: broken markup is tolerated but entities are never
+    resolved.
+    """
+    parser = getattr(_LOCAL, "rss_parser", None)
+    if parser is None:
+        parser = _LOCAL.rss_parser = etree.XMLParser(
+            recover=True, resolve_entities=False, no_network=True
+        )
+    return parser
+
+
+def _make_tree(markup: str | bytes, encoding: str | None = None) -> lxml.html.HtmlElement:
+    """Parse an HTML document or fragment with lxml.
+
+    Raw bytes are handed to libxml2 as-is so it can honour the page's own
+    ``<meta charset>``; ``encoding`` is only given when the server declared one,
+    and pages declaring nothing are read as UTF-8. A declared charset lxml does
+    not know is ignored in favour of the document's own declaration.
+    """
+    if isinstance(markup, str):
+        return lxml.html.document_fromstring(markup, parser=_html_parser(None))
+    if encoding is not None:
+        try:
+            return lxml.html.document_fromstring(markup, parser=_html_parser(encoding))
+        except LookupError:
+            logger.debug("Unknown charset %r, detecting from the document", encoding)
+    if not _META_CHARSET_RE.search(markup):
+        encoding = "utf-8"
+    else:
+        encoding = None
+    return lxml.html.document_fromstring(markup, parser=_html_parser(encoding))
+
+
+def _node_text(node: lxml.html.HtmlElement) -> str:
+    """Return the whitespace-normalised text content of ``node``."""
+    return " ".join(node.text_content().split())
+
+
+@lru_cache(maxsize=None)
+def _compile_selector(selector: str) -> CSSSelector:
+    """Translate a CSS selector into a compiled XPath expression, once per selector."""
+    return CSSSelector(selector, translator="html")
+
+
+def _precompile_selectors() -> None:
+    """Compile the selectors of every configured source ahead of the first scrape.
+
+    A bad selector is only logged here; it fails its own source when fetched.
+    """
+    _compile_selector(_PAGER_SELECTOR)
+    for source in SOURCES:
+        for selector in (source.get("selector", "li a"), source.get("pagination_selector")):
+            if not selector:
+                continue
+            try:
+                _compile_selector(selector)
+            except SelectorError as exc:
+                logger.error("Invalid selector %r for %s: %s", selector, source["name"], exc)
+
+
+_precompile_selectors()
+
+
+def _select_links(tree: lxml.html.HtmlElement, selector: str) -> List[Tuple[str, str | None]]:
+    """Return ``(text, href)`` pairs for the nodes matching ``selector``."""
+    return [(_node_text(node), node.get("href")) for node in _compile_selector(selector)(tree)]
+
+
+def _select_entries(
+    tree: lxml.html.HtmlElement, selector: str
+) -> List[Tuple[str, str | None, str, str]]:
+    """Return ``(text, href, summary, image)`` for the links matching ``selector``.
+
+    The summary comes from the link's ``title`` attribute or the first ``<p>`` of
+    its container, and the image from the container's first real ``<img>``, so
+    most items need no request to the article itself. The container is only used
+    when it holds no other matched link, since its text would otherwise belong to
+    a neighbouring item.
+    """
+    nodes = _compile_selector(selector)(tree)
+    # Count the matched links under every ancestor to spot shared containers
+    link_counts: Dict[lxml.html.HtmlElement, int] = {}
+    for node in nodes:
+        for ancestor in node.iterancestors():
+            link_counts[ancestor] = link_counts.get(ancestor, 0) + 1
+    entries = []
+    for node in nodes:
+        text = _node_text(node)
+        summary = node.get("title") or ""
+        image = ""
+        parent = node.getparent()
+        if parent is not None and link_counts.get(parent) == 1:
+            if not summary or summary == text:
+                para = parent.find(".//p")
+                summary = _node_text(para) if para is not None else ""
+            for img in parent.iter("img"):
+                image = _img_src(img)
+                if image:
+                    break
+        entries.append((text, node.get("href"), summary, image))
+    return entries
+
 
+def get_max_pages_from_soup(tree: lxml.html.HtmlElement) -> int:
+    """Detect the maximum page number from pagination links.
 
-def _parse_page(url: str, selector: str) -> Tuple[List[Dict[str, str]], BeautifulSoup]:
+    The pagination container is scanned first when the page has one; every link
+    on the page is checked when there is no container or it has no page numbers,
+    e.g. because it only holds prev/next links.
+    """
+    pagers = _compile_selector(_PAGER_SELECTOR)(tree)
+    scopes = [pagers[0], tree] if pagers else [tree]
+    for scope in scopes:
+        matches = (_PAGE_RE.search(href) for href in scope.xpath(".//a/@href"))
+        max_page = max((int(match.group(1)) for match in matches if match), default=0)
+        if max_page:
+            return max_page
+    return 1
+
+
+def _submit_details(link: str, preview: str, image: str) -> Tuple[str, str] | Future:
+    """Schedule a single article fetch if the preview or image is still missing."""
+    if preview and image:
+        return preview, image
+    return _PREVIEW_EXECUTOR.submit(extract_details, link, preview, image)
+
+
+def _result(details: Tuple[str, str] | Future) -> Tuple[str, str]:
+    """Return ``details`` itself or, for a pending fetch, its result."""
+    return details.result() if isinstance(details, Future) else details
+
+
+def _absolute_url(base_url: str, href: str) -> str:
+    """Resolve ``href`` against ``base_url``, skipping ``urljoin`` for absolute links."""
+    if href.startswith(("http://", "https://")):
+        return href
+    return urljoin(base_url, href)
+
+
+def _build_items(
+    tree: lxml.html.HtmlElement, selector: str, base_url: str, source_name: str
+) -> List[NewsItem]:
+    items = []
+    for title, href, summary, image in _select_entries(tree, selector):
+        if not (title and href):
+            continue
+        link = _absolute_url(base_url, href)
+        # Only fall back to fetching the article when the listing lacked the data
+        preview = summary[:200] if summary and summary != title else ""
+        image = _absolute_url(base_url, image) if image else ""
+        items.append((title, link, _submit_details(link, preview, image)))
+    return [
+        NewsItem(source_name, title, link, *_result(details))
+        for title, link, details in items
+    ]
+
+
+def _parse_page(
+    url: str, selector: str, source_name: str
+) -> Tuple[List[NewsItem], lxml.html.HtmlElement]:
     resp = _SESSION.get(url)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-    items = []
-    for a in soup.select(selector):
-        title = a.get_text(strip=True)
-        href = a.get("href")
-        if title and href:
-            link = urljoin(url, href)
-            preview = extract_preview(link)
-            image = extract_image(link)
-            items.append({"title": title, "link": link, "preview": preview, "image": image})
-    return items, soup
-
-
-def fetch_html_list(source: Dict[str, str], top_n: int | None = None) -> List[Dict[str, str]]:
+    tree = _make_tree(resp.content, resp.charset_encoding)
+    return _build_items(tree, selector, url, source_name), tree
+
+
+def fetch_html_list(source: Dict[str, str], top_n: int | None = None) -> List[NewsItem]:
     """Fetch list of links from a source that provides HTML."""
-    results: List[Dict[str, str]] = []
+    results: List[NewsItem] = []
+    name = source["name"]
+    base_url = source["url"]
     selector = source.get("selector", "li a")
+    pagination_param = source.get("pagination_param")
+    pagination_selector = source.get("pagination_selector")
 
-    if source.get("pagination_param"):
-        first_page_url = source["url"] + source["pagination_param"].format(page=1)
-        items, soup = _parse_page(first_page_url, selector)
+    if pagination_param:
+        first_page_url = base_url + pagination_param.format(page=1)
+        items, tree = _parse_page(first_page_url, selector, name)
         results.extend(items)
-        detected_max = get_max_pages_from_soup(soup)
+        detected_max = get_max_pages_from_soup(tree)
         cap = source.get("max_pages") or detected_max
         total_pages = min(detected_max, cap)
-        for page in range(2, total_pages + 1):
-            page_url = source["url"] + source["pagination_param"].format(page=page)
-            items, _ = _parse_page(page_url, selector)
-            results.extend(items)
-    elif source.get("pagination_selector"):
-        next_url = source["url"]
+        page_urls = [
+            base_url + pagination_param.format(page=page)
+            for page in range(2, total_pages + 1)
+        ]
+        # The page count is known up front, so fetch the rest concurrently;
+        # map() keeps the results in page order
+        if page_urls:
+            with ThreadPoolExecutor(max_workers=min(len(page_urls), 8)) as executor:
+                pages = executor.map(lambda url: _parse_page(url, selector, name)[0], page_urls)
+                for items in pages:
+                    results.extend(items)
+    elif pagination_selector:
+        next_url = base_url
         pages_fetched = 0
         cap = source.get("max_pages", float("inf"))
         while next_url and pages_fetched < cap:
-            items, soup = _parse_page(next_url, selector)
+            items, tree = _parse_page(next_url, selector, name)
             results.extend(items)
             pages_fetched += 1
-            next_link = soup.select_one(source["pagination_selector"])
-            if next_link and next_link.get("href"):
-                next_url = urljoin(source["url"], next_link["href"])
+            next_links = _select_links(tree, pagination_selector)
+            if next_links and next_links[0][1]:
+                next_url = _absolute_url(base_url, next_links[0][1])
             else:
                 break
     else:
-        items, _ = _parse_page(source["url"], selector)
+        items, _ = _parse_page(base_url, selector, name)
         results = items
 
-    return results[:top_n] if top_n else results
+    return results[:top_n] if top_n is not None else results
 
 
-def fetch_json_html_list(source: Dict[str, str], top_n: int | None = None) -> List[Dict[str, str]]:
+def fetch_json_html_list(source: Dict[str, str], top_n: int | None = None) -> List[NewsItem]:
     """Fetch list of links from a JSON endpoint containing HTML."""
     resp = _SESSION.get(source["url"])
     resp.raise_for_status()
     data = resp.json()
-    html = data.get(source.get("json_key", "html"), "")
-    soup = BeautifulSoup(html, "html.parser")
-    items = []
+    markup = data.get(source.get("json_key", "html"), "")
+    if not markup.strip():
+        return []
     selector = source.get("selector", "li a")
-    for a in soup.select(selector):
-        title = a.get_text(strip=True)
-        href = a.get("href")
-        if title and href:
-            link = urljoin(source["url"], href)
-            preview = extract_preview(link)
-            image = extract_image(link)
-            items.append({"title": title, "link": link, "preview": preview, "image": image})
-    return items[:top_n] if top_n else items
-
-
-def aggregate(top_n: int = 10) -> List[Dict[str, str]]:
-    """Aggregate most viewed news from configured sources."""
-    aggregated: List[Dict[str, str]] = []
-    for source in SOURCES:
-        try:
-            if source["parser"] == "html":
-                items = fetch_html_list(source, top_n)
-            elif source["parser"] == "json_html":
-                items = fetch_json_html_list(source, top_n)
-            elif source["parser"] == "rss":
-                feed = feedparser.parse(source["url"])
-                items = []
-                for e in feed.entries[:top_n]:
-                    preview = getattr(e, "summary", None) or getattr(e, "description", "")
-                    if preview:
-                        preview = BeautifulSoup(preview, "html.parser").get_text(strip=True)[:200]
-                    else:
-                        preview = extract_preview(e.link)
-                    image = extract_image(e.link)
-                    items.append({"title": e.title, "link": e.link, "preview": preview, "image": image})
-            else:
-                logger.warning("Unknown parser for %s", source["name"])
+    items = _build_items(_make_tree(markup), selector, source["url"], source["name"])
+    return items[:top_n] if top_n is not None else items
+
+
+def _strip_tags(markup: str) -> str:
+    """Return the plain text of an HTML snippet such as a feed summary.
+
+    Tags are stripped with a regex; a full parse is only needed when the snippet
+    carries ``<script>``/``<style>`` bodies whose text must be dropped too.
+    """
+    lowered = markup.lower()
+    if "<script" in lowered or "<style" in lowered:
+        fragment = lxml.html.fragment_fromstring(
+            markup, create_parent="div", parser=_html_parser(None)
+        )
+        etree.strip_elements(fragment, "script", "style", with_tail=False)
+        return _node_text(fragment)
+    return " ".join(html.unescape(_TAG_RE.sub("", markup)).split())
+
+
+def fetch_rss_list(source: Dict[str, str], top_n: int | None = None) -> List[NewsItem]:
+    """Fetch list of entries from an RSS feed."""
+    resp = _SESSION.get(source["url"])
+    resp.raise_for_status()
+    return parse_rss(resp.content, top_n, source["name"])
+
+
+def _numeric_entity(match: re.Match) -> bytes:
+    name = match.group(1)
+    if name in _XML_ENTITIES:
+        return match.group(0)
+    chars = _HTML5_ENTITIES.get(name.decode("ascii") + ";")
+    if chars is None:
+        return match.group(0)
+    return "".join(f"&#{ord(char)};" for char in chars).encode("ascii")
+
+
+def _entry_text(entry: etree._Element, *tags: str) -> str:
+    for tag in tags:
+        text = entry.findtext(tag)
+        if text and text.strip():
+            return text.strip()
+    return ""
+
+
+def _entry_link(entry: etree._Element) -> str:
+    link = _entry_text(entry, "link", _RSS1_NS + "link")
+    if link:
+        return link
+    for node in entry.iterfind(_ATOM_NS + "link"):
+        if node.get("rel", "alternate") == "alternate" and node.get("href"):
+            return node.get("href").strip()
+    return ""
+
+
+def _rss_image(item: etree._Element) -> str:
+    """Return the image attached to a feed entry via enclosure or Media RSS."""
+    for enclosure in item.iter("enclosure"):
+        if enclosure.get("type", "").startswith("image/") and enclosure.get("url"):
+            return enclosure.get("url")
+    for node in item.iterfind(_ATOM_NS + "link"):
+        if node.get("rel") == "enclosure" and node.get("type", "").startswith("image/"):
+            if node.get("href"):
+                return node.get("href")
+    for tag in ("content", "thumbnail"):
+        media = item.find(_MEDIA_NS + tag)
+        if media is not None and media.get("url"):
+            return media.get("url")
+    return ""
+
+
+def parse_rss(
+    xml_bytes: bytes, top_n: int | None = None, source_name: str = ""
+) -> List[NewsItem]:
+    """Extract title, link, preview and image from the entries of a feed.
+
+    RSS 2.0 ``<item>``, RSS 1.0 (RDF) items and Atom ``<entry>`` elements are
+    supported. Only the handful of fields we show are read, which is much cheaper
+    than a full feedparser pass with sanitising and date normalisation.
+    """
+    parser = _rss_parser()
+    root = etree.fromstring(_ENTITY_RE.sub(_numeric_entity, xml_bytes), parser=parser)
+    if parser.error_log:
+        logger.debug("Feed %s parsed with errors: %s", source_name, parser.error_log)
+    items = []
+    if root is not None:
+        for entry in islice(root.iter(*_FEED_ITEM_TAGS), top_n):
+            # CDATA titles keep their entities as text, so decode them like previews
+            title = html.unescape(
+                _entry_text(entry, "title", _RSS1_NS + "title", _ATOM_NS + "title")
+            )
+            link = _entry_link(entry)
+            if not (title and link):
                 continue
-            for item in items:
-                aggregated.append({
-                    "source": source["name"],
-                    "title": item["title"],
-                    "link": item["link"],
-                    "preview": item.get("preview", ""),
-                    "image": item.get("image", ""),
-                })
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.error("Error fetching %s: %s", source["name"], exc)
-
-    aggregated.sort(key=lambda x: (x["source"], x["title"]))
+            summary = _entry_text(
+                entry,
+                "description",
+                _RSS1_NS + "description",
+                _ATOM_NS + "summary",
+                _ATOM_NS + "content",
+            )
+            preview = _strip_tags(summary)[:200] if summary else ""
+            items.append((title, link, _submit_details(link, preview, _rss_image(entry))))
+    if not items and top_n != 0:
+        logger.warning("No items found in feed %s", source_name)
+    return [
+        NewsItem(source_name, title, link, *_result(details))
+        for title, link, details in items
+    ]
+
+
+def _warm_up_one(url: str) -> None:
+    try:
+        _SESSION.head(url, follow_redirects=False, timeout=2)
+    except httpx.HTTPError as exc:
+        logger.debug("Warm-up error %s: %s", url, exc)
+
+
+def warm_up() -> None:
+    """Open pooled connections to every source ahead of the first scrape.
+
+    DNS, TCP and TLS setup is paid here in parallel so the next :func:`aggregate`
+    finds keep-alive connections ready. Errors are ignored.
+    """
+    if not SOURCES:
+        return
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+        list(executor.map(_warm_up_one, [source["url"] for source in SOURCES]))
+
+
+def _fetch_one(source: Dict[str, str], top_n: int) -> List[NewsItem]:
+    """Fetch the items of a single source, logging instead of raising on errors."""
+    try:
+        if source["parser"] == "html":
+            return fetch_html_list(source, top_n)
+        if source["parser"] == "json_html":
+            return fetch_json_html_list(source, top_n)
+        if source["parser"] == "rss":
+            return fetch_rss_list(source, top_n)
+        logger.warning("Unknown parser for %s", source["name"])
+        return []
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Error fetching %s: %s", source["name"], exc)
+        return []
+
+
+def aggregate(top_n: int = 10) -> List[NewsItem]:
+    """Aggregate most viewed news from configured sources.
+
+    Sources are fetched concurrently since each one is independent network I/O.
+    Every source returns at most ``top_n`` items; values below 1 count as 1.
+    """
+    top_n = max(top_n, 1)
+    aggregated: List[NewsItem] = []
+    if not SOURCES:
+        return aggregated
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+        futures = [executor.submit(_fetch_one, source, top_n) for source in SOURCES]
+        for future in as_completed(futures):
+            aggregated.extend(future.result())
+
+    aggregated.sort(key=attrgetter("source", "title"))
     return aggregated
+
+
+def dumps_news(items: List[NewsItem]) -> bytes:
+    """Serialise news items to UTF-8 JSON, using orjson when available."""
+    records = [item._asdict() for item in items]
+    if orjson is not None:
+        return orjson.dumps(records)
+    return json.dumps(records, ensure_ascii=False).encode("utf-8")
+
+
+def aggregate_json(top_n: int = 10) -> bytes:
+    """Return :func:`aggregate` results as UTF-8 encoded JSON."""
+    return dumps_news(aggregate(top_n))
@@ -45,9 +45,9 @@ def main() -> None:
 
     news = aggregate(args.top)
     for idx, item in enumerate(news, start=1):
-        print(f"{idx}. [{item['source']}] {item['title']} - {item['link']}")
-        if item.get("preview"):
-            print(f"    {item['preview']}")
+        print(f"{idx}. [{item.source}] {item.title} - {item.link}")
+        if item.preview:
+            print(f"    {item.preview}")
 
 
 if __name__ == "__main__":
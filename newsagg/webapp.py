@@ -1,23 +1,59 @@
 from __future__ import annotations
 
-from flask import Flask, render_template, request
+import threading
+from typing import List
+
+from cachetools import TTLCache, cached
+from flask import Flask, Response, make_response, render_template, request
 
 import os
 
-from . import __version__, aggregate
+from . import __version__, NewsItem, aggregate, dumps_news, warm_up
 
 FILE_PATH = os.path.abspath(__file__)
 FILE_VERSION = __version__
 
+# Scraping every source takes seconds, so results are reused for a minute
+NEWS_CACHE_TTL = 60
+
 app = Flask(__name__)
+# Compile the template once at startup instead of checking it for changes
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.get_template("blog.html")
+
+
+@cached(TTLCache(maxsize=32, ttl=NEWS_CACHE_TTL), condition=threading.Condition())
+def cached_aggregate(top_n: int) -> List[NewsItem]:
+    """Return :func:`aggregate` results, memoized per ``top_n`` for a short TTL.
+
+    Concurrent misses for the same ``top_n`` wait for a single scrape.
+    """
+    return aggregate(top_n)
+
 
 @app.route("/")
-def index() -> str:
+def index() -> Response:
     """Render aggregated news as an HTML page."""
     top = request.args.get("n", type=int, default=10)
-    news = aggregate(top)
-    return render_template("blog.html", news=news)
+    news = cached_aggregate(top)
+    resp = make_response(render_template("blog.html", news=news))
+    resp.headers["Cache-Control"] = f"public, max-age={NEWS_CACHE_TTL}"
+    return resp
+
+
+@app.route("/api/news")
+def api_news() -> Response:
+    """Return aggregated news as JSON."""
+    top = request.args.get("n", type=int, default=10)
+    resp = Response(dumps_news(cached_aggregate(top)), mimetype="application/json")
+    resp.headers["Cache-Control"] = f"public, max-age={NEWS_CACHE_TTL}"
+    return resp
 
 
 if __name__ == "__main__":
+    # Open connections to the sources in the background so the first page is
+    # faster; only in the process that serves requests, not the reloader parent
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        threading.Thread(target=warm_up, name="newsagg-warm-up", daemon=True).start()
     app.run(debug=True)
@@ -0,0 +1,102 @@
+"""Fixture-based checks for the lxml feed parser."""
+
+from newsagg.aggregator import NewsItem, parse_rss
+
+RSS2 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>Feed</title>
+    <item>
+      <title>First</title>
+      <link>https://example.gr/1</link>
+      <description>&lt;p&gt;Hello &lt;b&gt;world&lt;/b&gt;&lt;/p&gt;</description>
+      <enclosure url="https://example.gr/1.jpg" type="image/jpeg" />
+    </item>
+    <item>
+      <title>Second</title>
+      <link>https://example.gr/2</link>
+      <description>Plain</description>
+      <media:content url="https://example.gr/2.jpg" />
+    </item>
+  </channel>
+</rss>
+"""
+
+RDF = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:media="http://search.yahoo.com/mrss/">
+  <channel rdf:about="https://example.gr/"><title>Feed</title></channel>
+  <item rdf:about="https://example.gr/r1">
+    <title>RDF item</title>
+    <link>https://example.gr/r1</link>
+    <description>RDF summary</description>
+    <media:thumbnail url="https://example.gr/r1.jpg" />
+  </item>
+</rdf:RDF>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Feed</title>
+  <entry>
+    <title>Atom entry</title>
+    <link rel="alternate" href="https://example.gr/a1" />
+    <link rel="enclosure" type="image/png" href="https://example.gr/a1.png" />
+    <summary>Atom summary</summary>
+  </entry>
+</feed>
+"""
+
+CDATA_TITLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><item>
+  <title><![CDATA[CDATA &rsquo; title]]></title>
+  <link>https://example.gr/c1</link>
+  <description><![CDATA[<p>Text &amp; more</p>]]></description>
+  <enclosure url="https://example.gr/c1.jpg" type="image/jpeg" />
+</item></channel></rss>
+"""
+
+UNDECLARED_ENTITY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><item>
+  <title>A&nbsp;B &amp; C&#8217;s</title>
+  <link>https://example.gr/e1</link>
+  <description>Caf&eacute;</description>
+  <enclosure url="https://example.gr/e1.jpg" type="image/jpeg" />
+</item></channel></rss>
+"""
+
+
+def test_rss2_items():
+    assert parse_rss(RSS2, None, "S") == [
+        NewsItem("S", "First", "https://example.gr/1", "Hello world", "https://example.gr/1.jpg"),
+        NewsItem("S", "Second", "https://example.gr/2", "Plain", "https://example.gr/2.jpg"),
+    ]
+
+
+def test_rss2_respects_top_n():
+    assert [item.title for item in parse_rss(RSS2, 1)] == ["First"]
+
+
+def test_rdf_items():
+    assert parse_rss(RDF) == [
+        NewsItem("", "RDF item", "https://example.gr/r1", "RDF summary", "https://example.gr/r1.jpg"),
+    ]
+
+
+def test_atom_entries():
+    assert parse_rss(ATOM) == [
+        NewsItem("", "Atom entry", "https://example.gr/a1", "Atom summary", "https://example.gr/a1.png"),
+    ]
+
+
+def test_cdata_title_entities_are_decoded():
+    (item,) = parse_rss(CDATA_TITLE)
+    assert item.title == "CDATA \u2019 title"
+    assert item.preview == "Text & more"
+
+
+def test_undeclared_html_entities_do_not_truncate_text():
+    (item,) = parse_rss(UNDECLARED_ENTITY)
+    assert item.title == "A\u00a0B & C\u2019s"
+    assert item.preview == "Café"